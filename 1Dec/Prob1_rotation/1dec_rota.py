@@ -1,9 +1,136 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Byte classes used by parse_rotations_array
+_INVALID, _SPACE, _DIGIT, _LEFT, _RIGHT = range(5)
+_BYTE_KIND = np.full(256, _INVALID, dtype=np.uint8)
+_BYTE_KIND[list(b" \t\r\n")] = _SPACE
+_BYTE_KIND[ord('0'):ord('9') + 1] = _DIGIT
+_BYTE_KIND[ord('L')] = _LEFT
+_BYTE_KIND[ord('R')] = _RIGHT
+
+# Longest distance parse_rotations_array accepts; 19 digits may overflow int64
+_MAX_DISTANCE_DIGITS = 18
+
+
 def read_rotations(filename):
     """Read rotations from a file, one per line."""
     with open(filename, 'r') as f:
         return [line.strip() for line in f if line.strip()]
 
 
+def parse_rotations_array(data):
+    """
+    Parse the raw bytes of a rotation file into a signed int64 array,
+    negative for L and positive for R, without building per-line strings.
+    
+    All rotations are parsed together one digit column at a time: column j
+    holds the byte j+1 places after each direction letter, and a rotation
+    keeps accumulating while its column bytes are still digits. Distances
+    are limited to _MAX_DISTANCE_DIGITS digits so they cannot overflow.
+    
+    Args:
+        data: Bytes of a rotation file
+    
+    Returns:
+        NumPy int64 array of signed distances, one per rotation
+    """
+    buf = np.frombuffer(data + b"\n", dtype=np.uint8)  # sentinel ends the last distance
+    kind = _BYTE_KIND[buf]
+    
+    if (kind == _INVALID).any():
+        direction = chr(buf[np.argmax(kind == _INVALID)])
+        raise ValueError(f"Invalid direction: {direction}. Must be L or R.")
+    
+    dir_idx = np.flatnonzero(kind >= _LEFT)
+    distances = np.zeros(dir_idx.size, dtype=np.int64)
+    
+    column = dir_idx + 1
+    active = kind[column] == _DIGIT
+    if not active.all():
+        raise ValueError("Every rotation needs a distance.")
+    digits_used = 0
+    
+    for width in range(_MAX_DISTANCE_DIGITS + 1):
+        if not active.any():
+            break
+        if width == _MAX_DISTANCE_DIGITS:
+            raise ValueError(f"Distances longer than {_MAX_DISTANCE_DIGITS} digits do not fit in int64.")
+        digit = buf[column].astype(np.int64) - ord('0')
+        np.multiply(distances, 10, out=distances, where=active)
+        np.add(distances, digit, out=distances, where=active)
+        digits_used += int(np.count_nonzero(active))
+        column += active  # finished rotations stay on their terminator
+        active &= kind[column] == _DIGIT
+    
+    if digits_used != np.count_nonzero(kind == _DIGIT):
+        raise ValueError("Distance found without a direction.")
+    
+    return np.where(kind[dir_idx] == _LEFT, -distances, distances)
+
+
+def read_rotations_array(filename):
+    """Read a whole rotation file into a signed int64 array (L negative, R positive)."""
+    with open(filename, 'rb') as f:
+        return parse_rotations_array(f.read())
+
+
+def iter_rotation_chunks(filename, chunk_bytes=1 << 22):
+    """
+    Stream a rotation file as int64 arrays of signed distances.
+    
+    The file is memory-mapped and cut into windows of about chunk_bytes
+    that end on a line boundary, and each window is parsed straight from
+    bytes by parse_rotations_array. Memory use depends on chunk_bytes, not
+    on the file size.
+    
+    Args:
+        filename: Path to the input file with rotations
+        chunk_bytes: Approximate number of bytes parsed per chunk
+    
+    Yields:
+        NumPy int64 arrays of signed distances, in file order
+    """
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            begin = 0
+            while begin < size:
+                newline = mm.find(b'\n', min(begin + chunk_bytes, size) - 1)
+                end = size if newline < 0 else newline + 1
+                yield parse_rotations_array(mm[begin:end])
+                begin = end
+
+
+def split_file_offsets(filename, chunks):
+    """
+    Split a file into roughly equal byte ranges that end on line boundaries.
+    
+    Args:
+        filename: Path to the input file with rotations
+        chunks: Desired number of ranges
+    
+    Returns:
+        List of (begin, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as f:
+        for i in range(1, chunks):
+            target = max(size * i // chunks, offsets[-1])
+            f.seek(target)
+            f.readline()  # move to the start of the next line
+            offsets.append(min(f.tell(), size))
+    offsets.append(size)
+    return [(b, e) for b, e in zip(offsets, offsets[1:]) if e > b]
+
+
 def apply_rotation(current_position, rotation, max_number=99):
     """
     Apply a rotation to the dial position.
@@ -58,6 +185,152 @@ def count_zero_positions(filename):
     return zero_count
 
 
+def count_zero_positions_batch(filename, start_position=50, max_number=99):
+    """
+    Vectorized count_zero_positions: the whole trajectory is a cumulative
+    sum of the signed distances taken modulo the dial size.
+    
+    Args:
+        filename: Path to the input file with rotations
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Count of times dial points at 0
+    """
+    modulo = max_number + 1
+    start_position %= modulo
+    zero_count, _ = _count_zero_positions_from(read_rotations_array(filename), start_position, modulo)
+    if start_position == 0:
+        zero_count += 1
+    return zero_count
+
+
+def _count_zero_positions_from(signed, start_position, modulo):
+    """
+    count_zero_positions_batch kernel for a run of rotations entered at a
+    known position. Returns (zeros at the end of rotations, exit position);
+    the starting position itself is not counted.
+    """
+    # Reduce each step first so the running sum stays small
+    positions = (start_position + np.cumsum(signed % modulo)) % modulo
+    zero_count = int(np.count_nonzero(positions == 0))
+    exit_position = int(positions[-1]) if positions.size else start_position
+    return zero_count, exit_position
+
+
+def summarize_rotations(signed, max_number=99):
+    """
+    Summarize a run of rotations as a transform of its entry position.
+    
+    Starting the run at position p, the dial ends at (p + offset) % modulo
+    and lands on 0 zero_counts[p] times. Rotation i ends on 0 exactly when
+    p is the negation of the running offset after it, so the table is a
+    bincount of those values.
+    
+    Args:
+        signed: Signed distances as returned by parse_rotations_array
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of (offset, zero_counts) with zero_counts indexed by entry position
+    """
+    modulo = max_number + 1
+    prefix = np.cumsum(signed % modulo) % modulo
+    offset = int(prefix[-1]) if prefix.size else 0
+    zero_counts = np.bincount((-prefix) % modulo, minlength=modulo)
+    return offset, zero_counts
+
+
+def _summarize_file_chunk(task):
+    """Process-pool worker: summarize the rotations in one byte range of a file."""
+    filename, begin, end, max_number = task
+    with open(filename, 'rb') as f:
+        f.seek(begin)
+        signed = parse_rotations_array(f.read(end - begin))
+    return summarize_rotations(signed, max_number)
+
+
+def count_zero_positions_parallel(filename, workers=None, start_position=50, max_number=99):
+    """
+    count_zero_positions using a process pool.
+    
+    The file is split on line boundaries, every chunk is summarized
+    independently by summarize_rotations, and the summaries are then
+    combined in file order, threading the dial position through them.
+    
+    Args:
+        filename: Path to the input file with rotations
+        workers: Number of worker processes (default: CPU count)
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Count of times dial points at 0
+    """
+    modulo = max_number + 1
+    workers = workers or os.cpu_count() or 1
+    tasks = [(filename, begin, end, max_number)
+             for begin, end in split_file_offsets(filename, workers)]
+    
+    position = start_position % modulo
+    zero_count = 1 if position == 0 else 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for offset, zero_counts in pool.map(_summarize_file_chunk, tasks):
+            zero_count += int(zero_counts[position])
+            position = (position + offset) % modulo
+    
+    return zero_count
+
+
+def count_zero_positions_streaming(filename, start_position=50, max_number=99, chunk_bytes=1 << 22):
+    """
+    count_zero_positions in constant memory: the chunks from
+    iter_rotation_chunks are processed one at a time, each entered at the
+    position the previous one left the dial, so the work per chunk does not
+    depend on the dial size.
+    
+    Args:
+        filename: Path to the input file with rotations
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+        chunk_bytes: Approximate number of bytes parsed per chunk
+    
+    Returns:
+        Count of times dial points at 0
+    """
+    modulo = max_number + 1
+    position = start_position % modulo
+    zero_count = 1 if position == 0 else 0
+    
+    for signed in iter_rotation_chunks(filename, chunk_bytes):
+        chunk_zeros, position = _count_zero_positions_from(signed, position, modulo)
+        zero_count += chunk_zeros
+    
+    return zero_count
+
+
+def count_zero_positions_all_starts(filename, max_number=99):
+    """
+    Count the zero positions for every possible starting position at once.
+    
+    A single summarize_rotations pass over the file yields the count for
+    each entry position; the starting position itself is counted when it
+    is 0, as in count_zero_positions.
+    
+    Args:
+        filename: Path to the input file with rotations
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        NumPy array where element p is the answer when starting at p
+    """
+    _, zero_counts = summarize_rotations(read_rotations_array(filename), max_number)
+    zero_counts[0] += 1
+    return zero_counts
+
+
 def main():
     # You can change this to your input file path
     input_file = "input.txt"
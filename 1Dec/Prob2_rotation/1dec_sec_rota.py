@@ -1,14 +1,203 @@
+import mmap
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Byte classes used by parse_rotations_array
+_INVALID, _SPACE, _DIGIT, _LEFT, _RIGHT = range(5)
+_BYTE_KIND = np.full(256, _INVALID, dtype=np.uint8)
+_BYTE_KIND[list(b" \t\r\n")] = _SPACE
+_BYTE_KIND[ord('0'):ord('9') + 1] = _DIGIT
+_BYTE_KIND[ord('L')] = _LEFT
+_BYTE_KIND[ord('R')] = _RIGHT
+
+# Longest distance parse_rotations_array accepts; 19 digits may overflow int64
+_MAX_DISTANCE_DIGITS = 18
+
+
 def read_rotations(filename):
     """Read rotations from a file, one per line."""
     with open(filename, 'r') as f:
         return [line.strip() for line in f if line.strip()]
 
 
+def parse_rotations_array(data):
+    """
+    Parse the raw bytes of a rotation file into a signed int64 array,
+    negative for L and positive for R, without building per-line strings.
+    
+    All rotations are parsed together one digit column at a time: column j
+    holds the byte j+1 places after each direction letter, and a rotation
+    keeps accumulating while its column bytes are still digits. Distances
+    are limited to _MAX_DISTANCE_DIGITS digits so they cannot overflow.
+    
+    Args:
+        data: Bytes of a rotation file
+    
+    Returns:
+        NumPy int64 array of signed distances, one per rotation
+    """
+    buf = np.frombuffer(data + b"\n", dtype=np.uint8)  # sentinel ends the last distance
+    kind = _BYTE_KIND[buf]
+    
+    if (kind == _INVALID).any():
+        direction = chr(buf[np.argmax(kind == _INVALID)])
+        raise ValueError(f"Invalid direction: {direction}. Must be L or R.")
+    
+    dir_idx = np.flatnonzero(kind >= _LEFT)
+    distances = np.zeros(dir_idx.size, dtype=np.int64)
+    
+    column = dir_idx + 1
+    active = kind[column] == _DIGIT
+    if not active.all():
+        raise ValueError("Every rotation needs a distance.")
+    digits_used = 0
+    
+    for width in range(_MAX_DISTANCE_DIGITS + 1):
+        if not active.any():
+            break
+        if width == _MAX_DISTANCE_DIGITS:
+            raise ValueError(f"Distances longer than {_MAX_DISTANCE_DIGITS} digits do not fit in int64.")
+        digit = buf[column].astype(np.int64) - ord('0')
+        np.multiply(distances, 10, out=distances, where=active)
+        np.add(distances, digit, out=distances, where=active)
+        digits_used += int(np.count_nonzero(active))
+        column += active  # finished rotations stay on their terminator
+        active &= kind[column] == _DIGIT
+    
+    if digits_used != np.count_nonzero(kind == _DIGIT):
+        raise ValueError("Distance found without a direction.")
+    
+    return np.where(kind[dir_idx] == _LEFT, -distances, distances)
+
+
+def read_rotations_array(filename):
+    """Read a whole rotation file into a signed int64 array (L negative, R positive)."""
+    with open(filename, 'rb') as f:
+        return parse_rotations_array(f.read())
+
+
+def iter_rotation_chunks(filename, chunk_bytes=1 << 22):
+    """
+    Stream a rotation file as int64 arrays of signed distances.
+    
+    The file is memory-mapped and cut into windows of about chunk_bytes
+    that end on a line boundary, and each window is parsed straight from
+    bytes by parse_rotations_array. Memory use depends on chunk_bytes, not
+    on the file size.
+    
+    Args:
+        filename: Path to the input file with rotations
+        chunk_bytes: Approximate number of bytes parsed per chunk
+    
+    Yields:
+        NumPy int64 arrays of signed distances, in file order
+    """
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            begin = 0
+            while begin < size:
+                newline = mm.find(b'\n', min(begin + chunk_bytes, size) - 1)
+                end = size if newline < 0 else newline + 1
+                yield parse_rotations_array(mm[begin:end])
+                begin = end
+
+
+def split_file_offsets(filename, chunks):
+    """
+    Split a file into roughly equal byte ranges that end on line boundaries.
+    
+    Args:
+        filename: Path to the input file with rotations
+        chunks: Desired number of ranges
+    
+    Returns:
+        List of (begin, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as f:
+        for i in range(1, chunks):
+            target = max(size * i // chunks, offsets[-1])
+            f.seek(target)
+            f.readline()  # move to the start of the next line
+            offsets.append(min(f.tell(), size))
+    offsets.append(size)
+    return [(b, e) for b, e in zip(offsets, offsets[1:]) if e > b]
+
+
+def count_zero_hits(start_position, direction, distance, max_number=99):
+    """
+    Count how many of the positions reached by clicks 1..distance are 0,
+    without walking the individual clicks.
+    
+    Moving right, the positions visited are start+1 .. start+distance, and
+    every multiple of the dial size in that interval is a hit on 0.
+    Moving left, the positions are start-distance .. start-1.
+    Counting multiples of m in an interval [a, b] is b // m - (a - 1) // m.
+    
+    Args:
+        start_position: Starting position of the dial
+        direction: 'L' or 'R'
+        distance: Number of clicks (>= 0)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Number of times the dial points at 0 during the rotation
+    """
+    modulo = max_number + 1
+    
+    if direction == 'R':
+        return (start_position + distance) // modulo - start_position // modulo
+    elif direction == 'L':
+        return (start_position - 1) // modulo - (start_position - distance - 1) // modulo
+    else:
+        raise ValueError(f"Invalid direction: {direction}. Must be L or R.")
+
+
 def count_zeros_during_rotation(start_position, rotation, max_number=99):
     """
     Count how many times the dial points at 0 DURING a rotation,
     including all intermediate positions visited during the rotation.
     
+    Important: We count zeros we arrive at during the rotation, not the starting position.
+    A rotation involves 'distance' clicks (movements), so positions 1 through distance
+    are considered. The count is computed in O(1) by count_zero_hits; see
+    count_zeros_during_rotation_by_clicks for the click-by-click version.
+    
+    Args:
+        start_position: Starting position of the dial (0-99)
+        rotation: String like 'L68' or 'R48'
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of (count of zeros during rotation, final position after rotation)
+    """
+    direction = rotation[0]  # L or R
+    distance = int(rotation[1:])  # Extract the number
+    modulo = max_number + 1  # 100
+    
+    zero_count = count_zero_hits(start_position, direction, distance, max_number)
+    
+    if direction == 'R':
+        final_position = (start_position + distance) % modulo
+    else:
+        final_position = (start_position - distance) % modulo
+    
+    return zero_count, final_position
+
+
+def count_zeros_during_rotation_by_clicks(start_position, rotation, max_number=99):
+    """
+    Reference implementation of count_zeros_during_rotation that walks
+    the dial one click at a time. O(distance); kept for cross-checking.
+    
     Important: We count zeros we arrive at during the rotation, not the starting position.
     A rotation involves 'distance' clicks (movements), so we check positions 1 through distance.
     
@@ -73,6 +262,505 @@ def count_zero_positions_during_rotations(filename):
     return zero_count
 
 
+def count_zeros_batch(filename, start_position=50, max_number=99):
+    """
+    Vectorized Day 1 solver for large rotation files.
+    
+    The end positions are a cumulative sum of the signed distances modulo
+    the dial size; the zeros passed during each rotation then follow from the
+    same closed form as count_zero_hits, applied to every rotation at once.
+    
+    Args:
+        filename: Path to the input file with rotations
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of (Part 1 answer, Part 2 answer): zeros at the end of rotations,
+        counting the starting position when it is 0 as count_zero_positions
+        does, and zeros during rotations
+    """
+    modulo = max_number + 1
+    start_position %= modulo
+    end_zeros, during_zeros, _ = _count_zeros_from(
+        read_rotations_array(filename), start_position, modulo)
+    if start_position == 0:
+        end_zeros += 1
+    return end_zeros, during_zeros
+
+
+def _count_zeros_from(signed, start_position, modulo):
+    """
+    count_zeros_batch kernel for a run of rotations entered at a known
+    position. Returns (zeros at the end of rotations, zeros during
+    rotations, exit position); the starting position itself is not counted.
+    """
+    # Reduce each step first so the running sum stays small
+    positions = (start_position + np.cumsum(signed % modulo)) % modulo
+    previous = np.empty_like(positions)
+    previous[:1] = start_position
+    previous[1:] = positions[:-1]
+    
+    end_zeros = int(np.count_nonzero(positions == 0))
+    
+    distance = np.abs(signed)
+    right_hits = (previous + distance) // modulo
+    left_hits = (previous - 1) // modulo - (previous - distance - 1) // modulo
+    during_zeros = int(np.where(signed > 0, right_hits, left_hits).sum())
+    
+    exit_position = int(positions[-1]) if positions.size else start_position
+    return end_zeros, during_zeros, exit_position
+
+
+def _count_arc_coverage(arc_start, arc_length, modulo):
+    """
+    Count how many arcs cover each dial position using a difference array.
+    Arc i covers arc_length[i] (< modulo) positions from arc_start[i],
+    wrapping past the top of the dial.
+    """
+    arc_end = arc_start + arc_length
+    wraps = arc_end > modulo
+    
+    diff = np.bincount(arc_start, minlength=modulo + 1)
+    diff -= np.bincount(np.minimum(arc_end, modulo), minlength=modulo + 1)
+    # Wrapped arcs continue from position 0
+    diff[0] += np.count_nonzero(wraps)
+    diff -= np.bincount(arc_end[wraps] - modulo, minlength=modulo + 1)
+    
+    return np.cumsum(diff[:modulo])
+
+
+def summarize_rotations(signed, max_number=99):
+    """
+    Summarize a run of rotations as a transform of its entry position.
+    
+    Starting the run at position p, the dial ends at (p + offset) % modulo,
+    ends a rotation on 0 end_counts[p] times and passes 0 during_counts[p]
+    times. For one rotation of d = a * modulo + r clicks, every entry
+    position passes 0 a times, plus once more for an arc of r entry
+    positions, so the during table is built with a difference array.
+    
+    Args:
+        signed: Signed distances as returned by parse_rotations_array
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of (offset, end_counts, during_counts) indexed by entry position
+    """
+    modulo = max_number + 1
+    prefix = np.cumsum(signed % modulo) % modulo
+    offset = int(prefix[-1]) if prefix.size else 0
+    end_counts = np.bincount((-prefix) % modulo, minlength=modulo)
+    
+    # Offset of the dial before each rotation, relative to the entry position
+    before = np.empty_like(prefix)
+    before[:1] = 0
+    before[1:] = prefix[:-1]
+    
+    distance = np.abs(signed)
+    full_turns = int((distance // modulo).sum())
+    rest = distance % modulo
+    
+    # A right turn passes 0 once more when it starts in [modulo - r, modulo),
+    # a left turn when it starts in [1, r]
+    arc_start = np.where(signed > 0, modulo - rest, 1)
+    arc_start = (arc_start - before) % modulo
+    during_counts = _count_arc_coverage(arc_start, rest, modulo) + full_turns
+    
+    return offset, end_counts, during_counts
+
+
+def _summarize_file_chunk(task):
+    """Process-pool worker: summarize the rotations in one byte range of a file."""
+    filename, begin, end, max_number = task
+    with open(filename, 'rb') as f:
+        f.seek(begin)
+        signed = parse_rotations_array(f.read(end - begin))
+    return summarize_rotations(signed, max_number)
+
+
+def count_zeros_parallel(filename, workers=None, start_position=50, max_number=99):
+    """
+    count_zeros_batch using a process pool.
+    
+    The file is split on line boundaries, every chunk is summarized
+    independently by summarize_rotations, and the summaries are then
+    combined in file order, threading the dial position through them.
+    
+    Args:
+        filename: Path to the input file with rotations
+        workers: Number of worker processes (default: CPU count)
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of (Part 1 answer, Part 2 answer): zeros at the end of rotations,
+        counting the starting position when it is 0 as count_zero_positions
+        does, and zeros during rotations
+    """
+    modulo = max_number + 1
+    workers = workers or os.cpu_count() or 1
+    tasks = [(filename, begin, end, max_number)
+             for begin, end in split_file_offsets(filename, workers)]
+    
+    position = start_position % modulo
+    end_zeros = 1 if position == 0 else 0
+    during_zeros = 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for offset, end_counts, during_counts in pool.map(_summarize_file_chunk, tasks):
+            end_zeros += int(end_counts[position])
+            during_zeros += int(during_counts[position])
+            position = (position + offset) % modulo
+    
+    return end_zeros, during_zeros
+
+
+def count_zeros_streaming(filename, start_position=50, max_number=99, chunk_bytes=1 << 22):
+    """
+    count_zeros_batch in constant memory: the chunks from
+    iter_rotation_chunks are processed one at a time, each entered at the
+    position the previous one left the dial, so the work per chunk does not
+    depend on the dial size.
+    
+    Args:
+        filename: Path to the input file with rotations
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+        chunk_bytes: Approximate number of bytes parsed per chunk
+    
+    Returns:
+        Tuple of (Part 1 answer, Part 2 answer): zeros at the end of rotations,
+        counting the starting position when it is 0 as count_zero_positions
+        does, and zeros during rotations
+    """
+    modulo = max_number + 1
+    position = start_position % modulo
+    end_zeros = 1 if position == 0 else 0
+    during_zeros = 0
+    
+    for signed in iter_rotation_chunks(filename, chunk_bytes):
+        chunk_end, chunk_during, position = _count_zeros_from(signed, position, modulo)
+        end_zeros += chunk_end
+        during_zeros += chunk_during
+    
+    return end_zeros, during_zeros
+
+
+def count_zeros_all_starts(filename, max_number=99):
+    """
+    Answer both Day 1 parts for every possible starting position at once.
+    
+    A single summarize_rotations pass over the file yields both tables.
+    
+    Args:
+        filename: Path to the input file with rotations
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        Tuple of NumPy arrays (Part 1 answers, Part 2 answers) where element p
+        is the answer when starting at p; the Part 1 answer for p = 0 counts
+        the starting position, as count_zero_positions does
+    """
+    _, end_counts, during_counts = summarize_rotations(read_rotations_array(filename), max_number)
+    end_counts[0] += 1
+    return end_counts, during_counts
+
+
+def count_visits_per_position(filename, start_position=50, max_number=99):
+    """
+    Count how many clicks land on every dial position, the histogram
+    version of count_zero_positions_during_rotations.
+    
+    A rotation of d = a * modulo + r clicks lands on every position a times
+    and on an arc of r further positions once. Whole turns are added in
+    bulk and the arcs are recorded as difference-array range updates, so the
+    cost is O(rotations + dial size) whatever the distances are.
+    
+    Args:
+        filename: Path to the input file with rotations
+        start_position: Starting position of the dial (default 50)
+        max_number: Maximum number on the dial (default 99)
+    
+    Returns:
+        NumPy array of max_number + 1 visit counts, indexed by position
+    """
+    modulo = max_number + 1
+    signed = read_rotations_array(filename)
+    start_position %= modulo
+    
+    positions = (start_position + np.cumsum(signed % modulo)) % modulo
+    previous = np.empty_like(positions)
+    previous[:1] = start_position
+    previous[1:] = positions[:-1]
+    
+    distance = np.abs(signed)
+    full_turns = int((distance // modulo).sum())
+    rest = distance % modulo
+    
+    # Right turns cover previous+1 .. previous+r, left turns previous-r .. previous-1
+    arc_start = np.where(signed > 0, previous + 1, previous - rest) % modulo
+    
+    return _count_arc_coverage(arc_start, rest, modulo) + full_turns
+
+
+def _compose_summaries(first, second, modulo):
+    """
+    Combine the summaries of two consecutive runs of rotations. The second
+    run is entered at the first run's exit, so its tables are read shifted by
+    the first run's offset.
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    offset_a, end_a, during_a = first
+    offset_b, end_b, during_b = second
+    return (
+        (offset_a + offset_b) % modulo,
+        end_a + np.roll(end_b, -offset_a),
+        during_a + np.roll(during_b, -offset_a),
+    )
+
+
+# Subtrees smaller than this keep no tables; their summaries are rebuilt from
+# the signed distances when a parent needs them
+_TABLE_MIN_SIZE = 16
+
+
+def _signed_distance(rotation):
+    """Parse one rotation string into its signed distance (L negative, R positive)."""
+    direction = rotation[0]
+    if direction not in ('L', 'R'):
+        raise ValueError(f"Invalid direction: {direction}. Must be L or R.")
+    distance = int(rotation[1:])
+    return -distance if direction == 'L' else distance
+
+
+class _RotationNode:
+    __slots__ = ("signed", "priority", "left", "right", "size", "summary")
+    
+    def __init__(self, signed, priority):
+        self.signed = signed
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+        self.summary = None
+
+
+class RotationTree:
+    """
+    Editable rotation list for "what-if" questions over the Day 1 answers.
+    
+    The rotations are kept in an implicit treap (ordered by list position).
+    Nodes with at least _TABLE_MIN_SIZE rotations below them store the
+    summarize_rotations summary of their subtree, so an update, insertion or
+    deletion only recomposes the O(log n) nodes on one path. Smaller subtrees
+    store only their signed distances and are summarized on the fly. Each
+    composition costs O(max_number + _TABLE_MIN_SIZE).
+    """
+    
+    def __init__(self, rotations, start_position=50, max_number=99, seed=None):
+        self.max_number = max_number
+        self.modulo = max_number + 1
+        self.start_position = start_position % self.modulo
+        self._random = random.Random(seed)
+        
+        signed = parse_rotations_array("\n".join(rotations).encode())
+        if signed.size != len(rotations):
+            raise ValueError("Every rotation must be one direction and distance.")
+        
+        # Heap-ordered priorities in level order keep the built tree a valid treap
+        priorities = sorted((self._random.random() for _ in rotations), reverse=True)
+        nodes = [_RotationNode(s, 0.0) for s in signed.tolist()]
+        self.root = self._build(nodes, signed, 0, len(nodes))
+        
+        level = [self.root] if self.root else []
+        i = 0
+        while level:
+            next_level = []
+            for node in level:
+                node.priority = priorities[i]
+                i += 1
+                next_level.extend(child for child in (node.left, node.right) if child)
+            level = next_level
+    
+    def __len__(self):
+        return self.root.size if self.root else 0
+    
+    def _build(self, nodes, signed, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._build(nodes, signed, lo, mid)
+        node.right = self._build(nodes, signed, mid + 1, hi)
+        node.size = hi - lo
+        if node.size >= _TABLE_MIN_SIZE:
+            # The subtree is exactly signed[lo:hi], summarized in one pass
+            node.summary = summarize_rotations(signed[lo:hi], self.max_number)
+        return node
+    
+    def _pull(self, node):
+        left, right = node.left, node.right
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        if node.size < _TABLE_MIN_SIZE:
+            node.summary = None
+            return
+        
+        # Runs of untabled rotations are gathered and summarized together
+        summary = None
+        pending = []
+        for part in (left, node, right):
+            if part is None:
+                continue
+            if part is node:
+                pending.append(node.signed)
+            elif part.summary is None:
+                self._collect(part, pending)
+            else:
+                if pending:
+                    summary = self._compose_pending(summary, pending)
+                    pending = []
+                summary = _compose_summaries(summary, part.summary, self.modulo)
+        node.summary = self._compose_pending(summary, pending) if pending else summary
+    
+    def _compose_pending(self, summary, pending):
+        run = summarize_rotations(np.array(pending, dtype=np.int64), self.max_number)
+        return _compose_summaries(summary, run, self.modulo)
+    
+    @staticmethod
+    def _collect(node, out):
+        """Append the signed distances of a subtree to out, in order."""
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            out.append(node.signed)
+            node = node.right
+    
+    def _summary(self, node):
+        if node.summary is not None:
+            return node.summary
+        signed = []
+        self._collect(node, signed)
+        return summarize_rotations(np.array(signed, dtype=np.int64), self.max_number)
+    
+    def _split(self, node, count):
+        """Split into (first count rotations, the rest)."""
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if count <= left_size:
+            first, node.left = self._split(node.left, count)
+            self._pull(node)
+            return first, node
+        node.right, rest = self._split(node.right, count - left_size - 1)
+        self._pull(node)
+        return node, rest
+    
+    def _merge(self, first, second):
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first.priority > second.priority:
+            first.right = self._merge(first.right, second)
+            self._pull(first)
+            return first
+        second.left = self._merge(first, second.left)
+        self._pull(second)
+        return second
+    
+    def _check_index(self, index, size):
+        if not 0 <= index < size:
+            raise IndexError(f"Rotation index {index} out of range.")
+    
+    def answers(self):
+        """
+        Return the (Part 1, Part 2) answers for the current rotation list,
+        as count_zeros_batch would.
+        """
+        start_hit = 1 if self.start_position == 0 else 0
+        if self.root is None:
+            return start_hit, 0
+        _, end_counts, during_counts = self._summary(self.root)
+        return (int(end_counts[self.start_position]) + start_hit,
+                int(during_counts[self.start_position]))
+    
+    def update(self, index, rotation):
+        """Replace the rotation at index and return the new answers."""
+        self._check_index(index, len(self))
+        head, rest = self._split(self.root, index)
+        old, tail = self._split(rest, 1)
+        node = _RotationNode(_signed_distance(rotation), old.priority)
+        self.root = self._merge(self._merge(head, node), tail)
+        return self.answers()
+    
+    def insert(self, index, rotation):
+        """Insert a rotation before position index and return the new answers."""
+        self._check_index(index, len(self) + 1)
+        node = _RotationNode(_signed_distance(rotation), self._random.random())
+        head, tail = self._split(self.root, index)
+        self.root = self._merge(self._merge(head, node), tail)
+        return self.answers()
+    
+    def delete(self, index):
+        """Remove the rotation at index and return the new answers."""
+        self._check_index(index, len(self))
+        head, rest = self._split(self.root, index)
+        _, tail = self._split(rest, 1)
+        self.root = self._merge(head, tail)
+        return self.answers()
+    
+    def rotations(self):
+        """Return the current rotation strings in order (a zero turn reads R0)."""
+        signed = []
+        self._collect(self.root, signed)
+        return [f"L{-s}" if s < 0 else f"R{s}" for s in signed]
+
+
+class DialTracker:
+    """
+    Keep the dial position and both zero counts up to date as rotations
+    arrive, so a growing log never has to be replayed.
+    
+    Each rotation costs O(1) via count_zeros_during_rotation.
+    """
+    
+    def __init__(self, start_position=50, max_number=99):
+        self.max_number = max_number
+        self.position = start_position % (max_number + 1)
+        # Part 1: rotations that end on 0, plus the start when it is 0
+        self.end_zeros = 1 if self.position == 0 else 0
+        self.during_zeros = 0  # Part 2: every click that lands on 0
+    
+    def add(self, rotation):
+        """Apply one rotation string like 'L68' and return the new position."""
+        zeros, self.position = count_zeros_during_rotation(self.position, rotation, self.max_number)
+        self.during_zeros += zeros
+        if self.position == 0:
+            self.end_zeros += 1
+        return self.position
+    
+    def extend(self, rotations):
+        """Apply rotations in order and return the new position."""
+        for rotation in rotations:
+            self.add(rotation)
+        return self.position
+    
+    def snapshot(self):
+        """Return the tracker state as a (position, end_zeros, during_zeros) tuple."""
+        return self.position, self.end_zeros, self.during_zeros
+    
+    def restore(self, state):
+        """Reset the tracker to a state previously returned by snapshot."""
+        self.position, self.end_zeros, self.during_zeros = state
+
+
 def main():
     # You can change this to your input file path
     input_file = "input.txt"
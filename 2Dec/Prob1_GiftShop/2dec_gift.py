@@ -68,6 +68,26 @@ def is_in_any_range(n: int, merged_ranges: List[Tuple[int, int]], starts, ends)
     return n <= ends[idx]
 
 
+def count_and_sum_repeated(lo: int, hi: int, block_len: int, repeats: int) -> Tuple[int, int]:
+    """
+    Count and sum the IDs in [lo, hi] made of one block_len-digit block
+    repeated `repeats` times, without enumerating them.
+
+    Such an ID is block * M with M = (10^(L*k) - 1) / (10^L - 1), i.e.
+    1 followed by k-1 copies of L-1 zeros and a 1 (e.g. 1001001 for L=3,
+    k=3). The matching blocks form a contiguous run, so the IDs form an
+    arithmetic progression with step M.
+    """
+    multiplier = (10 ** (block_len * repeats) - 1) // (10**block_len - 1)
+    first_block = max(10 ** (block_len - 1), -(-lo // multiplier))  # ceil division
+    last_block = min(10**block_len - 1, hi // multiplier)
+
+    if last_block < first_block:
+        return 0, 0
+    count = last_block - first_block + 1
+    return count, multiplier * (first_block + last_block) * count // 2
+
+
 def sum_invalid_ids(ranges: List[Tuple[int, int]]) -> int:
     """
     An ID is invalid if it is made of some sequence of digits repeated twice,
@@ -108,6 +128,21 @@ def sum_invalid_ids(ranges: List[Tuple[int, int]]) -> int:
     return total
 
 
+def sum_invalid_ids_closed_form(ranges: List[Tuple[int, int]]) -> int:
+    """
+    Same result as sum_invalid_ids, but each range contributes one
+    arithmetic-series sum per even digit length instead of enumerating
+    halves. Works for ranges up to 10^18 and beyond.
+    """
+    total = 0
+    for start, end in merge_ranges(ranges):
+        for digits in range(len(str(start)), len(str(end)) + 1):
+            if digits % 2 == 0:
+                _, s = count_and_sum_repeated(start, end, digits // 2, 2)
+                total += s
+    return total
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")
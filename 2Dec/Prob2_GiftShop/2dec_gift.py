@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
-from bisect import bisect_right
-from typing import List, Tuple
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 
 def read_ranges_from_file(path: str) -> List[Tuple[int, int]]:
@@ -68,6 +71,45 @@ def is_in_any_range(n: int, starts, ends) -> bool:
     return n <= ends[idx]
 
 
+def mobius(n: int) -> int:
+    """
+    Möbius function: 0 if n has a squared prime factor, otherwise (-1)
+    raised to the number of prime factors of n.
+    """
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def count_and_sum_repeated(lo: int, hi: int, block_len: int, repeats: int) -> Tuple[int, int]:
+    """
+    Count and sum the IDs in [lo, hi] made of one block_len-digit block
+    repeated `repeats` times, without enumerating them.
+
+    Such an ID is block * M with M = (10^(L*k) - 1) / (10^L - 1), i.e.
+    1 followed by k-1 copies of L-1 zeros and a 1 (e.g. 1001001 for L=3,
+    k=3). The matching blocks form a contiguous run, so the IDs form an
+    arithmetic progression with step M.
+    """
+    multiplier = (10 ** (block_len * repeats) - 1) // (10**block_len - 1)
+    first_block = max(10 ** (block_len - 1), -(-lo // multiplier))  # ceil division
+    last_block = min(10**block_len - 1, hi // multiplier)
+
+    if last_block < first_block:
+        return 0, 0
+    count = last_block - first_block + 1
+    return count, multiplier * (first_block + last_block) * count // 2
+
+
 def sum_invalid_ids(ranges: List[Tuple[int, int]]) -> int:
     """
     Now, an ID is invalid if it is made only of some sequence of digits
@@ -123,6 +165,404 @@ def sum_invalid_ids(ranges: List[Tuple[int, int]]) -> int:
     return sum(invalid_ids)
 
 
+def sum_repeated_by_pattern(ranges: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """
+    For every (block length, repeat count) pattern, count and sum the IDs
+    of that shape inside the given ranges using count_and_sum_repeated.
+
+    The patterns overlap: 111111 is counted under (1, 6), (2, 3) and (3, 2).
+    The totals per pattern are exact, so they can be combined with an
+    overlap correction but must not simply be added.
+
+    Returns:
+        Dict mapping (block_len, repeats) to (count, sum)
+    """
+    result: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    for start, end in merge_ranges(ranges):
+        for digits in range(len(str(start)), len(str(end)) + 1):
+            for block_len in range(1, digits // 2 + 1):
+                if digits % block_len:
+                    continue
+                key = (block_len, digits // block_len)
+                count, s = count_and_sum_repeated(start, end, *key)
+                if count:
+                    prev_count, prev_sum = result.get(key, (0, 0))
+                    result[key] = (prev_count + count, prev_sum + s)
+    return result
+
+
+def count_and_sum_invalid_ids(ranges: List[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Count and sum the invalid IDs in the ranges without a dedup set.
+
+    An ID of D digits whose shortest repeating block has length P appears
+    in the pattern (L, D/L) for every L that is a multiple of P and divides
+    D. Weighting pattern (L, k) by -mobius(k) makes those appearances add up
+    to exactly 1 when P < D (Möbius inversion over the divisors of D), so
+    every invalid ID is counted once. Memory use is constant.
+
+    Returns:
+        Tuple of (number of invalid IDs, sum of invalid IDs)
+    """
+    total_count = 0
+    total_sum = 0
+    for (block_len, repeats), (count, s) in sum_repeated_by_pattern(ranges).items():
+        weight = -mobius(repeats)
+        total_count += weight * count
+        total_sum += weight * s
+    return total_count, total_sum
+
+
+class DigitAutomaton(ABC):
+    """
+    A rule over the decimal digits of an ID, read left to right.
+
+    Subclasses define start(length) -> state, step(state, digit) -> state
+    (None rejects the ID) and accepts(state) -> bool. States must be
+    hashable; DigitDP memoizes on them, so a rule with few distinct states
+    is evaluated over a range without enumerating its IDs.
+    """
+
+    @abstractmethod
+    def start(self, length: int):
+        """Initial state for IDs of the given length, or None if none match."""
+
+    @abstractmethod
+    def step(self, state, digit: int):
+        """State after reading digit, or None to reject the ID."""
+
+    @abstractmethod
+    def accepts(self, state) -> bool:
+        """Whether a complete ID ending in state matches the rule."""
+
+
+class RepeatedBlockAutomaton(DigitAutomaton):
+    """
+    Accept IDs made of one digit block repeated several times.
+
+    With exact_repeats=2 this is the Part 1 rule (55, 6464, 123123); with
+    min_repeats=2 it is the Part 2 rule (also 111, 12121212, ...).
+
+    The state keeps the leading digits up to the longest candidate block and
+    the block lengths still consistent with every digit read so far. That
+    is about 10^(length/2) states, so count_and_sum_matching_ids uses the
+    closed forms (count_and_sum_repeated, count_and_sum_invalid_ids) for the
+    rules they cover.
+    """
+
+    def __init__(self, min_repeats: int = 2, exact_repeats: Optional[int] = None):
+        self.min_repeats = min_repeats
+        self.exact_repeats = exact_repeats
+
+    def start(self, length: int):
+        if self.exact_repeats is not None:
+            repeats = [self.exact_repeats]
+        else:
+            repeats = range(self.min_repeats, length + 1)
+        blocks = tuple(length // k for k in repeats if length % k == 0)
+        if not blocks:
+            return None
+        return 0, (), blocks
+
+    def step(self, state, digit: int):
+        pos, prefix, blocks = state
+        blocks = tuple(b for b in blocks if pos < b or prefix[pos % b] == digit)
+        if not blocks:
+            return None
+        if pos < max(blocks):
+            prefix = prefix + (digit,)
+        return pos + 1, prefix, blocks
+
+    def accepts(self, state) -> bool:
+        return bool(state[2])
+
+
+class DigitDP:
+    """
+    Count and sum the IDs in [lo, hi] accepted by a DigitAutomaton.
+
+    Numbers are built digit by digit. Once a prefix is strictly between the
+    bounds the remaining digits are free, and the (count, sum) of all free
+    completions from a given automaton state is memoized.
+    """
+
+    def __init__(self, automaton: DigitAutomaton):
+        self.automaton = automaton
+        self._memo: Dict[Tuple, Tuple[int, int]] = {}
+
+    def _free(self, length: int, pos: int, state) -> Tuple[int, int]:
+        """(count, sum of the remaining digits' value) over free completions."""
+        if pos == length:
+            return (1, 0) if self.automaton.accepts(state) else (0, 0)
+
+        key = (length, pos, state)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        count = 0
+        total = 0
+        place = 10 ** (length - pos - 1)
+        for digit in range(10):
+            nxt = self.automaton.step(state, digit)
+            if nxt is None:
+                continue
+            c, s = self._free(length, pos + 1, nxt)
+            count += c
+            total += digit * place * c + s
+
+        self._memo[key] = (count, total)
+        return count, total
+
+    def _up_to(self, n: int) -> Tuple[int, int]:
+        """(count, sum) of accepted IDs in [1, n]."""
+        if n <= 0:
+            return 0, 0
+
+        digits = [int(ch) for ch in str(n)]
+        length = len(digits)
+        count = 0
+        total = 0
+
+        # All IDs with fewer digits than n
+        for shorter in range(1, length):
+            state = self.automaton.start(shorter)
+            if state is None:
+                continue
+            for digit in range(1, 10):
+                nxt = self.automaton.step(state, digit)
+                if nxt is None:
+                    continue
+                c, s = self._free(shorter, 1, nxt)
+                count += c
+                total += digit * 10 ** (shorter - 1) * c + s
+
+        # IDs with as many digits as n: follow n's digits, branching below them
+        state = self.automaton.start(length)
+        prefix_value = 0
+        for pos, limit in enumerate(digits):
+            if state is None:
+                break
+            for digit in range(1 if pos == 0 else 0, limit):
+                nxt = self.automaton.step(state, digit)
+                if nxt is None:
+                    continue
+                c, s = self._free(length, pos + 1, nxt)
+                count += c
+                total += (prefix_value * 10 + digit) * 10 ** (length - pos - 1) * c + s
+            state = self.automaton.step(state, limit)
+            prefix_value = prefix_value * 10 + limit
+
+        if state is not None and self.automaton.accepts(state):
+            count += 1
+            total += n
+
+        return count, total
+
+    def count_and_sum(self, lo: int, hi: int) -> Tuple[int, int]:
+        """(count, sum) of accepted IDs in [lo, hi]."""
+        if hi < lo:
+            return 0, 0
+        count_hi, sum_hi = self._up_to(hi)
+        count_lo, sum_lo = self._up_to(lo - 1)
+        return count_hi - count_lo, sum_hi - sum_lo
+
+
+def _count_and_sum_exact_repeats(
+    merged: List[Tuple[int, int]], repeats: int
+) -> Tuple[int, int]:
+    """
+    Count and sum the IDs made of one block repeated exactly `repeats` times.
+    A digit count fixes the block length, so the patterns do not overlap.
+    """
+    total_count = 0
+    total_sum = 0
+    for start, end in merged:
+        for digits in range(len(str(start)), len(str(end)) + 1):
+            if digits % repeats == 0:
+                count, s = count_and_sum_repeated(start, end, digits // repeats, repeats)
+                total_count += count
+                total_sum += s
+    return total_count, total_sum
+
+
+def count_and_sum_matching_ids(
+    ranges: List[Tuple[int, int]], automaton: DigitAutomaton
+) -> Tuple[int, int]:
+    """
+    Count and sum the IDs accepted by automaton in any of the ranges.
+    Ranges are merged first so overlapping ranges count each ID once.
+
+    RepeatedBlockAutomaton rules with exact_repeats, or with min_repeats=2,
+    are answered by the closed forms instead of DigitDP.
+    """
+    merged = merge_ranges(ranges)
+    if isinstance(automaton, RepeatedBlockAutomaton):
+        if automaton.exact_repeats is not None:
+            return _count_and_sum_exact_repeats(merged, automaton.exact_repeats)
+        if automaton.min_repeats == 2:
+            return count_and_sum_invalid_ids(merged)
+
+    dp = DigitDP(automaton)
+    total_count = 0
+    total_sum = 0
+    for start, end in merged:
+        count, s = dp.count_and_sum(start, end)
+        total_count += count
+        total_sum += s
+    return total_count, total_sum
+
+
+# The two Day 2 rules as automata. DigitDP on them carries the leading
+# digits in its state, so memoization rarely hits and one range up to 10^12
+# takes minutes; count_and_sum_matching_ids answers them by closed form.
+REPEATED_TWICE = RepeatedBlockAutomaton(exact_repeats=2)
+REPEATED_AT_LEAST_TWICE = RepeatedBlockAutomaton(min_repeats=2)
+
+
+def _iter_repeated_ids(
+    max_digits: int, exact_repeats: Optional[int], chunk: int
+) -> Iterator[np.ndarray]:
+    """
+    Yield every repeated-block ID with at most max_digits digits as sorted,
+    duplicate-free uint64 chunks in increasing order.
+
+    Each digit count is cut into value windows spanning `chunk` blocks of
+    its longest block length, the densest pattern. Every pattern's IDs
+    inside a window are a contiguous run of blocks, so a window holds at
+    most about `chunk` IDs per pattern and can be deduplicated on its own.
+    """
+    for digits in range(2, max_digits + 1):
+        patterns = []
+        for block_len in range(1, digits // 2 + 1):
+            repeats = digits // block_len
+            if digits % block_len or (exact_repeats is not None and repeats != exact_repeats):
+                continue
+            patterns.append((block_len, (10**digits - 1) // (10**block_len - 1)))
+        if not patterns:
+            continue
+
+        widest, widest_multiplier = patterns[-1]
+        for first in range(10 ** (widest - 1), 10**widest, chunk):
+            lo = first * widest_multiplier
+            hi = min(first + chunk, 10**widest) * widest_multiplier - 1
+            parts = []
+            for block_len, multiplier in patterns:
+                first_block = max(10 ** (block_len - 1), -(-lo // multiplier))
+                last_block = min(10**block_len - 1, hi // multiplier)
+                if first_block <= last_block:
+                    blocks = np.arange(first_block, last_block + 1, dtype=np.uint64)
+                    parts.append(blocks * np.uint64(multiplier))
+            values = np.sort(np.concatenate(parts))
+            keep = np.empty(values.size, dtype=bool)
+            keep[:1] = True
+            np.not_equal(values[1:], values[:-1], out=keep[1:])
+            yield values[keep]
+
+
+def build_repeated_table(
+    max_digits: int,
+    exact_repeats: Optional[int] = None,
+    path: Optional[str] = None,
+    chunk: int = 1 << 22,
+) -> np.ndarray:
+    """
+    Build the sorted table of every repeated-block ID with at most
+    max_digits digits (at most 18, so IDs fit in 64 bits), together with
+    prefix sums for range queries.
+
+    By default blocks repeated at least twice are included (the Part 2
+    rule); exact_repeats=2 gives the Part 1 table.
+
+    The IDs are generated in sorted chunks and written straight into the
+    result, so working memory stays around `chunk` IDs. The table itself
+    holds 24 bytes per ID: about 24 MB for 12 digits but about 24 GB for
+    18, so give a path for large tables to build them into a .npy memmap.
+
+    Returns:
+        uint64 array of shape (3, n + 1): row 0 holds the n sorted IDs
+        followed by max_digits, rows 1 and 2 hold prefix sums of the high
+        and low 32 bits of the IDs, so sums cannot overflow.
+    """
+    if not 1 <= max_digits <= 18:
+        raise ValueError("max_digits must be between 1 and 18.")
+
+    rule = RepeatedBlockAutomaton(exact_repeats=exact_repeats)
+    size, _ = count_and_sum_matching_ids([(1, 10**max_digits - 1)], rule)
+    shape = (3, size + 1)
+    if path is None:
+        table = np.zeros(shape, dtype=np.uint64)
+    else:
+        table = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint64, shape=shape)
+
+    pos = 0
+    for values in _iter_repeated_ids(max_digits, exact_repeats, chunk):
+        end = pos + values.size
+        table[0, pos:end] = values
+        np.cumsum(values >> np.uint64(32), out=table[1, pos + 1 : end + 1])
+        np.cumsum(values & np.uint64(0xFFFFFFFF), out=table[2, pos + 1 : end + 1])
+        table[1:, pos + 1 : end + 1] += table[1:, pos : pos + 1]
+        pos = end
+
+    # The unused slot after the IDs records the digit limit of the table
+    table[0, -1] = max_digits
+    return table
+
+
+def save_repeated_table(path: str, max_digits: int, exact_repeats: Optional[int] = None) -> None:
+    """Build a repeated-block table directly into a .npy file."""
+    table = build_repeated_table(max_digits, exact_repeats, path=path)
+    table.flush()
+
+
+def load_repeated_table(path: str) -> np.ndarray:
+    """Memory-map a table written by save_repeated_table."""
+    return np.load(path, mmap_mode="r")
+
+
+def _check_table_bound(table: np.ndarray, hi: int) -> None:
+    """Reject ranges reaching past the IDs a table was built for."""
+    max_digits = int(table[0, -1])
+    if hi >= 10**max_digits:
+        raise ValueError(f"Range end {hi} exceeds the table's {max_digits}-digit limit.")
+
+
+def table_range_sum(table: np.ndarray, lo: int, hi: int) -> int:
+    """
+    Sum the table IDs in [lo, hi] with two binary searches over the sorted
+    IDs, the same way build_range_index and is_in_any_range look up ranges.
+    """
+    _check_table_bound(table, hi)
+    values = table[0, :-1]
+    i = bisect_left(values, lo)
+    j = bisect_right(values, hi)
+    if j <= i:
+        return 0
+    high = int(table[1, j]) - int(table[1, i])
+    low = int(table[2, j]) - int(table[2, i])
+    return (high << 32) + low
+
+
+def sum_ranges_with_table(table: np.ndarray, ranges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Answer many ranges at once: both ends of every range are located with
+    one vectorized searchsorted call each.
+
+    Returns:
+        The sum of the table IDs inside each range, in input order
+    """
+    if not ranges:
+        return []
+    _check_table_bound(table, max(end for _, end in ranges))
+    values = table[0, :-1]
+    bounds = np.array(ranges, dtype=np.uint64).reshape(-1, 2)
+    i = np.searchsorted(values, bounds[:, 0], side="left")
+    j = np.maximum(np.searchsorted(values, bounds[:, 1], side="right"), i)
+    high = (table[1, j] - table[1, i]).tolist()
+    low = (table[2, j] - table[2, i]).tolist()
+    return [(h << 32) + lo for h, lo in zip(high, low)]
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")
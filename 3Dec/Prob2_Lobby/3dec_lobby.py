@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
-from typing import List
+from typing import Iterator, List, Tuple
+
+import numpy as np
 
 
 def read_banks_from_file(path: str) -> List[str]:
@@ -13,13 +15,44 @@ def read_banks_from_file(path: str) -> List[str]:
     return lines
 
 
+def select_max_digits(bank: bytes, k: int) -> bytes:
+    """
+    Pick k digits from bank, keeping their order, so that the resulting
+    number is as large as possible.
+    
+    Runs in O(n) with a monotonic stack over the raw ASCII bytes: a digit
+    is popped whenever a larger digit follows it and there are still digits
+    left to drop (n - k in total).
+    
+    Args:
+        bank: ASCII digits, e.g. b"987654321111111"
+        k: Number of digits to select
+    
+    Returns:
+        The selected digits as bytes, or b"" if the bank is shorter than k
+    """
+    n = len(bank)
+    if n < k:
+        return b""
+    
+    to_drop = n - k
+    stack = bytearray()
+    for digit in bank:
+        while to_drop and stack and stack[-1] < digit:
+            stack.pop()
+            to_drop -= 1
+        stack.append(digit)
+    
+    return bytes(stack[:k])
+
+
 def max_joltage_from_bank(bank: str, k: int = 12) -> int:
     """
     Find the maximum k-digit joltage possible from a bank.
     Must select exactly k batteries (digits) in order.
     
-    Uses a greedy algorithm: for each position in the result, pick the largest
-    digit possible while ensuring we can still pick enough remaining digits.
+    Uses select_max_digits, which is equivalent to greedily picking the
+    largest digit that still leaves enough digits for the rest of the result.
     
     Args:
         bank: String of digits representing battery joltages
@@ -28,38 +61,10 @@ def max_joltage_from_bank(bank: str, k: int = 12) -> int:
     Returns:
         Maximum k-digit number that can be formed
     """
-    n = len(bank)
-    if n < k:
+    if len(bank) < k:
         return 0
     
-    if n == k:
-        return int(bank)
-    
-    result_digits = []
-    start_idx = 0
-    
-    # For each position in the result (0 to k-1)
-    for pos in range(k):
-        # We need to pick (k - pos) more digits
-        # We can look at digits from start_idx to (n - (k - pos) + 1)
-        # to ensure we have enough digits left
-        end_idx = n - (k - pos) + 1
-        
-        # Find the maximum digit in the allowed range
-        max_digit = -1
-        max_idx = -1
-        for i in range(start_idx, end_idx):
-            digit = int(bank[i])
-            if digit > max_digit:
-                max_digit = digit
-                max_idx = i
-        
-        # Add the maximum digit to result
-        result_digits.append(str(max_digit))
-        # Start next search from after the selected position
-        start_idx = max_idx + 1
-    
-    return int(''.join(result_digits))
+    return int(select_max_digits(bank.encode("ascii"), k))
 
 
 def total_output_joltage(banks: List[str]) -> int:
@@ -74,6 +79,189 @@ def total_output_joltage(banks: List[str]) -> int:
     return total
 
 
+def read_bank_matrix(path: str) -> np.ndarray:
+    """
+    Read a file of equal-length banks as a 2-D uint8 array of digit values,
+    one row per bank.
+    """
+    with open(path, "rb") as f:
+        data = f.read().replace(b"\r", b"").strip() + b"\n"
+    
+    width = data.index(b"\n")
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if buf.size % (width + 1) or (buf[width :: width + 1] != ord("\n")).any():
+        raise ValueError("Batch mode needs all banks to have the same length.")
+    
+    return buf.reshape(-1, width + 1)[:, :width] - ord("0")
+
+
+def total_output_joltage_batch(digits: np.ndarray, k: int = 12) -> int:
+    """
+    Vectorized total_output_joltage over a matrix from read_bank_matrix.
+    
+    Every bank picks its next digit at the same time: a per-row argmax over
+    the window that still leaves enough digits, with the columns before
+    each row's previous pick masked out. argmax returns the leftmost
+    maximum, which matches the scalar greedy choice.
+    """
+    rows, n = digits.shape
+    if n < k:
+        return 0
+    
+    signed = digits.astype(np.int8)  # room for the -1 mask value
+    columns = np.arange(n)
+    start = np.zeros(rows, dtype=np.int64)
+    total = 0
+    
+    for pos in range(k):
+        end = n - (k - pos) + 1
+        window = np.where(columns[:end] >= start[:, None], signed[:, :end], -1)
+        picked = np.argmax(window, axis=1)
+        # Column sums stay small, so the place values are applied in Python ints
+        total += int(digits[np.arange(rows), picked].sum(dtype=np.int64)) * 10 ** (k - 1 - pos)
+        start = picked + 1
+    
+    return total
+
+
+_NON_DIGITS = bytes(b for b in range(256) if not ord("0") <= b <= ord("9"))
+
+
+def _iter_line_pieces(path: str, chunk_bytes: int) -> Iterator[Tuple[bytes, bool]]:
+    """
+    Read path chunk_bytes at a time and yield (digits, ends_line) pieces:
+    the digit bytes of part of a line, and whether that part ends the line.
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                break
+            pieces = chunk.split(b"\n")
+            for piece in pieces[:-1]:
+                yield piece.translate(None, _NON_DIGITS), True
+            yield pieces[-1].translate(None, _NON_DIGITS), False
+    yield b"", True  # the last line may not end with a newline
+
+
+def iter_max_joltages_streaming(path: str, k: int = 12, chunk_bytes: int = 1 << 20) -> Iterator[int]:
+    """
+    Yield max_joltage_from_bank for every bank in the file without holding
+    any bank in memory.
+    
+    A first pass only measures the banks. The second pass runs the
+    select_max_digits stack with its size capped at k: once k digits are
+    held, a digit that cannot displace anything is dropped straight away,
+    which uses up the same drop budget (n - k) that popping it later would.
+    Each bank needs O(k) memory plus one chunk.
+    """
+    lengths = []
+    n = 0
+    for digits, ends_line in _iter_line_pieces(path, chunk_bytes):
+        n += len(digits)
+        if ends_line and n:
+            lengths.append(n)
+            n = 0
+    
+    bank_lengths = iter(lengths)
+    stack = bytearray()
+    to_drop = None
+    for digits, ends_line in _iter_line_pieces(path, chunk_bytes):
+        if digits and to_drop is None:
+            n = next(bank_lengths)
+            to_drop = n - k
+        for digit in digits:
+            while to_drop > 0 and stack and stack[-1] < digit:
+                stack.pop()
+                to_drop -= 1
+            if len(stack) < k:
+                stack.append(digit)
+            else:
+                to_drop -= 1
+        if ends_line and to_drop is not None:
+            yield int(stack) if n >= k else 0
+            stack.clear()
+            to_drop = None
+
+
+def total_output_joltage_streaming(path: str, k: int = 12, chunk_bytes: int = 1 << 20) -> int:
+    """
+    total_output_joltage for banks too large to load, reading the file in
+    chunks of chunk_bytes via iter_max_joltages_streaming.
+    """
+    return sum(iter_max_joltages_streaming(path, k, chunk_bytes))
+
+
+class BankIndex:
+    """
+    Sparse table over one bank for range-maximum queries that return the
+    leftmost position of the largest digit.
+    
+    Building costs O(n log n); afterwards the greedy selection for any k is
+    k O(1) queries, so every k from 1 to 12 (or more) can be answered from
+    the same index.
+    """
+    
+    def __init__(self, bank: str):
+        self.digits = bank.encode("ascii")
+        n = len(self.digits)
+        # table[j][i] is the leftmost argmax of digits[i : i + 2**j]
+        self.table = [list(range(n))]
+        width = 1
+        while 2 * width <= n:
+            prev = self.table[-1]
+            row = []
+            for i in range(n - 2 * width + 1):
+                a, b = prev[i], prev[i + width]
+                row.append(b if self.digits[b] > self.digits[a] else a)
+            self.table.append(row)
+            width *= 2
+    
+    def argmax(self, lo: int, hi: int) -> int:
+        """Leftmost index of the largest digit in digits[lo..hi] (inclusive)."""
+        level = (hi - lo + 1).bit_length() - 1
+        a = self.table[level][lo]
+        b = self.table[level][hi - (1 << level) + 1]
+        if self.digits[b] > self.digits[a]:
+            return b
+        return a if self.digits[a] > self.digits[b] else min(a, b)
+    
+    def max_joltage(self, k: int) -> int:
+        """Same result as max_joltage_from_bank(bank, k), in O(k)."""
+        n = len(self.digits)
+        if n < k:
+            return 0
+        
+        value = 0
+        start = 0
+        for pos in range(k):
+            picked = self.argmax(start, n - (k - pos))
+            value = value * 10 + self.digits[picked] - ord("0")
+            start = picked + 1
+        return value
+
+
+def max_joltages_all_k(bank: str, max_k: int = 12) -> List[int]:
+    """
+    Return the maximum joltage for every k from 1 to max_k, using one
+    BankIndex for the bank. Element i is the answer for k = i + 1.
+    """
+    index = BankIndex(bank)
+    return [index.max_joltage(k) for k in range(1, max_k + 1)]
+
+
+def total_output_joltage_all_k(banks: List[str], max_k: int = 12) -> List[int]:
+    """
+    Total output joltage across all banks for every k from 1 to max_k.
+    Element i is the total for k = i + 1.
+    """
+    totals = [0] * max_k
+    for bank in banks:
+        for i, value in enumerate(max_joltages_all_k(bank, max_k)):
+            totals[i] += value
+    return totals
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")
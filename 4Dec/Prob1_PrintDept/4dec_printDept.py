@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from typing import List, Tuple
 
+import numpy as np
+
 
 def read_grid_from_file(path: str) -> List[str]:
     """
@@ -79,6 +81,222 @@ def count_accessible_rolls(grid: List[str]) -> int:
     return accessible_count
 
 
+def read_grid_array(path: str) -> np.ndarray:
+    """
+    Read the grid straight into a 2-D boolean array (True where there is a
+    roll of paper) without building per-row strings.
+    """
+    with open(path, "rb") as f:
+        data = f.read().replace(b"\r", b"").strip() + b"\n"
+    
+    width = data.index(b"\n")
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if buf.size % (width + 1) or (buf[width :: width + 1] != ord("\n")).any():
+        raise ValueError("All grid rows must have the same length.")
+    
+    return buf.reshape(-1, width + 1)[:, :width] == ord("@")
+
+
+def grid_to_array(grid: List[str]) -> np.ndarray:
+    """Convert a grid given as strings into a 2-D boolean roll array."""
+    if not grid:
+        return np.zeros((0, 0), dtype=bool)
+    return np.array([list(row) for row in grid]) == "@"
+
+
+def count_adjacent_rolls_array(rolls: np.ndarray) -> np.ndarray:
+    """
+    Vectorized count_adjacent_rolls for every cell at once.
+    
+    The grid is padded with one empty cell on each side and the 8 shifted
+    views of the padded grid are summed, so the bounds checks disappear.
+    
+    Args:
+        rolls: 2-D boolean array, True where there is a roll
+    
+    Returns:
+        uint8 array of the same shape with the number of adjacent rolls (0-8)
+    """
+    rows, cols = rolls.shape
+    padded = np.pad(rolls, 1).view(np.uint8)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue  # Skip the position itself
+            counts += padded[dr : dr + rows, dc : dc + cols]
+    
+    return counts
+
+
+def accessible_rolls_array(rolls: np.ndarray) -> Tuple[int, np.ndarray]:
+    """
+    Vectorized count_accessible_rolls.
+    
+    Args:
+        rolls: 2-D boolean array, True where there is a roll
+    
+    Returns:
+        Tuple of (number of accessible rolls, boolean mask of accessible rolls)
+    """
+    mask = rolls & (count_adjacent_rolls_array(rolls) < 4)
+    return int(np.count_nonzero(mask)), mask
+
+
+_ROLL_BITS = str.maketrans("@.", "10")
+
+
+def grid_to_bitboard(grid: List[str]) -> List[int]:
+    """
+    Pack each grid row into one Python integer, with bit c set when
+    column c holds a roll of paper.
+    """
+    return [int(row.translate(_ROLL_BITS)[::-1], 2) for row in grid]
+
+
+def accessible_bits(bitboard: List[int], cols: int) -> List[int]:
+    """
+    For every row, return the bits of the rolls with fewer than 4 adjacent
+    rolls, working on whole rows at a time.
+    
+    The 8 neighbor planes are the rows above, below and the row itself,
+    shifted one column left and right. They are added with bit-sliced
+    counters: ones and twos hold the low two bits of the count per column,
+    and fours is set once the count reaches 4.
+    """
+    mask = (1 << cols) - 1
+    rows = len(bitboard)
+    result = []
+    
+    for r in range(rows):
+        up = bitboard[r - 1] if r > 0 else 0
+        down = bitboard[r + 1] if r + 1 < rows else 0
+        row = bitboard[r]
+        
+        ones = twos = fours = 0
+        for plane in (
+            (up << 1) & mask, up, up >> 1,
+            (row << 1) & mask, row >> 1,
+            (down << 1) & mask, down, down >> 1,
+        ):
+            carry = ones & plane
+            ones ^= plane
+            fours |= twos & carry
+            twos ^= carry
+        
+        result.append(row & ~fours)
+    
+    return result
+
+
+def count_accessible_rolls_bitboard(grid: List[str]) -> int:
+    """
+    Same result as count_accessible_rolls, computed on a bitboard with
+    one integer per row.
+    """
+    if not grid:
+        return 0
+    
+    bits = accessible_bits(grid_to_bitboard(grid), len(grid[0]))
+    return sum(row.bit_count() for row in bits)
+
+
+NEIGHBORHOOD_SHAPES = ("chebyshev", "von_neumann")
+
+
+def _square_sums(padded: np.ndarray, radius: int, dtype) -> np.ndarray:
+    """
+    Sum of every (2r+1) x (2r+1) window of a grid padded by r on each side,
+    as four slices of one summed-area table.
+    """
+    k = 2 * radius + 1
+    table = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=dtype)
+    np.cumsum(np.cumsum(padded, axis=0, dtype=dtype), axis=1, out=table[1:, 1:])
+    return table[k:, k:] - table[:-k, k:] - table[k:, :-k] + table[:-k, :-k]
+
+
+def _diamond_sums(padded: np.ndarray, radius: int, dtype) -> np.ndarray:
+    """
+    Sum of every diamond |dr| + |dc| <= r of a grid padded by r on each side.
+    
+    A diamond is 2r+1 row segments. With row prefix sums P, the segment
+    right ends P[i+d, j+r-|d|+1] lie on one anti-diagonal for d >= 0 and on
+    one diagonal for d < 0 (the left ends likewise), so prefix sums of P
+    along both diagonal directions give each diamond from four differences.
+    """
+    height, width = padded.shape
+    row_prefix = np.zeros((height, width + 1), dtype=dtype)
+    np.cumsum(padded, axis=1, dtype=dtype, out=row_prefix[:, 1:])
+    
+    # diag[a + 1, b + 1] sums row_prefix down the diagonal ending at (a, b);
+    # anti[a + 1, b] sums it down the anti-diagonal ending at (a, b)
+    diag = np.zeros((height + 1, width + 2), dtype=dtype)
+    anti = np.zeros((height + 1, width + 2), dtype=dtype)
+    for a in range(height):
+        np.add(row_prefix[a], diag[a, :-1], out=diag[a + 1, 1:])
+        np.add(row_prefix[a], anti[a, 1:], out=anti[a + 1, :-1])
+    
+    rows, cols = height - 2 * radius, width - 2 * radius
+    
+    def at(table, dr, dc):
+        # table entries at (center row + dr, center column + dc) for every cell
+        return table[radius + dr : radius + dr + rows, radius + dc : radius + dc + cols]
+    
+    right = (at(anti, radius + 1, 1) - at(anti, 0, radius + 2)
+             + at(diag, 0, radius + 1) - at(diag, -radius, 1))
+    left = (at(diag, radius + 1, 1) - at(diag, 0, -radius)
+            + at(anti, 0, 1 - radius) - at(anti, -radius, 1))
+    return right - left
+
+
+def neighborhood_counts(rolls: np.ndarray, shape: str = "chebyshev", radius: int = 1) -> np.ndarray:
+    """
+    Count the rolls in the radius-r neighborhood of every cell, excluding
+    the cell itself, in O(1) per cell from prefix sums.
+    
+    "chebyshev" is the (2r+1) x (2r+1) square (radius 1 is the usual 8
+    neighbors), read from a summed-area table. "von_neumann" is the diamond
+    |dr| + |dc| <= r, read from diagonal prefix sums of the row prefix sums.
+    The grid is padded by r empty cells so every lookup is a plain slice,
+    and the tables are int32 whenever the counts fit.
+    
+    Args:
+        rolls: 2-D boolean array, True where there is a roll
+        shape: "chebyshev" or "von_neumann"
+        radius: Neighborhood radius (>= 1)
+    
+    Returns:
+        Integer array of the same shape with the neighbor counts
+    """
+    if shape not in NEIGHBORHOOD_SHAPES:
+        raise ValueError(f"Invalid neighborhood shape: {shape}. Must be one of {NEIGHBORHOOD_SHAPES}.")
+    
+    padded = np.pad(rolls, radius)
+    dtype = np.int32 if (padded.shape[0] + 1) * (padded.shape[1] + 2) < 2**31 else np.int64
+    if shape == "chebyshev":
+        totals = _square_sums(padded, radius, dtype)
+    else:
+        totals = _diamond_sums(padded, radius, dtype)
+    return totals - rolls
+
+
+def count_accessible_rolls_configurable(
+    grid: List[str], shape: str = "chebyshev", radius: int = 1, threshold: int = 4
+) -> int:
+    """
+    count_accessible_rolls with a configurable rule: a roll is accessible
+    when fewer than threshold rolls lie in its neighborhood. The defaults
+    reproduce count_accessible_rolls.
+    """
+    if not grid:
+        return 0
+    
+    rolls = grid_to_array(grid)
+    accessible = rolls & (neighborhood_counts(rolls, shape, radius) < threshold)
+    return int(np.count_nonzero(accessible))
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")
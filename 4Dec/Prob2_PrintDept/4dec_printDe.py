@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import os
-from typing import List
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 
 def read_grid_from_file(path: str) -> List[str]:
@@ -96,6 +100,470 @@ def remove_accessible_rolls_iteratively(grid: List[str]) -> int:
     return total_removed
 
 
+def peel_rolls(grid: List[str]) -> Tuple[int, List[List[int]]]:
+    """
+    Worklist version of remove_accessible_rolls_iteratively.
+    
+    Neighbor counts are computed once. Each round removes the rolls queued
+    for it, decrements their neighbors' counts, and queues for the next
+    round only the neighbors that just dropped below 4. Counts only ever go
+    down, so this removes exactly the rolls the full rescans would, in the
+    same rounds, with O(cells) total work.
+    
+    Args:
+        grid: The grid as a list of strings
+    
+    Returns:
+        Tuple of (total rolls removed, per-cell removal round), where the
+        round is 1 for rolls removed in the first pass and 0 for cells that
+        are empty or never removed
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    rounds = [[0] * cols for _ in range(rows)]
+    if rows == 0:
+        return 0, rounds
+    
+    offsets = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+    present = [[ch == '@' for ch in row] for row in grid]
+    counts = [[count_adjacent_rolls(grid, r, c) if present[r][c] else 0 for c in range(cols)]
+              for r in range(rows)]
+    
+    frontier = [(r, c) for r in range(rows) for c in range(cols)
+                if present[r][c] and counts[r][c] < 4]
+    for r, c in frontier:
+        rounds[r][c] = 1
+    
+    total_removed = 0
+    current_round = 1
+    while frontier:
+        for r, c in frontier:
+            present[r][c] = False
+        total_removed += len(frontier)
+        
+        next_frontier = []
+        for r, c in frontier:
+            for dr, dc in offsets:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and present[nr][nc]:
+                    counts[nr][nc] -= 1
+                    # Queue each roll once, on the round its count first drops below 4
+                    if counts[nr][nc] == 3 and not rounds[nr][nc]:
+                        rounds[nr][nc] = current_round + 1
+                        next_frontier.append((nr, nc))
+        
+        frontier = next_frontier
+        current_round += 1
+    
+    return total_removed, rounds
+
+
+_ROLL_BITS = str.maketrans("@.", "10")
+
+
+def grid_to_bitboard(grid: List[str]) -> List[int]:
+    """
+    Pack each grid row into one Python integer, with bit c set when
+    column c holds a roll of paper.
+    """
+    return [int(row.translate(_ROLL_BITS)[::-1], 2) for row in grid]
+
+
+def accessible_bits(bitboard: List[int], cols: int) -> List[int]:
+    """
+    For every row, return the bits of the rolls with fewer than 4 adjacent
+    rolls, working on whole rows at a time.
+    
+    The 8 neighbor planes are the rows above, below and the row itself,
+    shifted one column left and right. They are added with bit-sliced
+    counters: ones and twos hold the low two bits of the count per column,
+    and fours is set once the count reaches 4.
+    """
+    mask = (1 << cols) - 1
+    rows = len(bitboard)
+    result = []
+    
+    for r in range(rows):
+        up = bitboard[r - 1] if r > 0 else 0
+        down = bitboard[r + 1] if r + 1 < rows else 0
+        row = bitboard[r]
+        
+        ones = twos = fours = 0
+        for plane in (
+            (up << 1) & mask, up, up >> 1,
+            (row << 1) & mask, row >> 1,
+            (down << 1) & mask, down, down >> 1,
+        ):
+            carry = ones & plane
+            ones ^= plane
+            fours |= twos & carry
+            twos ^= carry
+        
+        result.append(row & ~fours)
+    
+    return result
+
+
+def remove_accessible_rolls_bitboard(grid: List[str]) -> int:
+    """
+    Same result as remove_accessible_rolls_iteratively, with every round
+    computed on a bitboard with one integer per row.
+    """
+    if not grid:
+        return 0
+    
+    cols = len(grid[0])
+    bitboard = grid_to_bitboard(grid)
+    total_removed = 0
+    
+    while True:
+        to_remove = accessible_bits(bitboard, cols)
+        removed = sum(row.bit_count() for row in to_remove)
+        if not removed:
+            break
+        
+        bitboard = [row & ~gone for row, gone in zip(bitboard, to_remove)]
+        total_removed += removed
+    
+    return total_removed
+
+
+def _grid_file_shape(path: str) -> Tuple[int, int, int]:
+    """
+    Return (rows, cols, size) of a grid file whose rows all have the same
+    length. size counts the bytes up to the last grid character; trailing
+    newlines and blank lines at EOF are ignored, as read_grid_from_file does.
+    """
+    with open(path, "rb") as f:
+        cols = len(f.readline().rstrip(b"\n"))
+        if cols == 0:
+            return 0, 0, 0
+        
+        # Scan back from EOF past trailing whitespace, one block at a time
+        size = os.fstat(f.fileno()).st_size
+        while size:
+            begin = max(size - 4096, 0)
+            f.seek(begin)
+            stripped = f.read(size - begin).rstrip()
+            size = begin + len(stripped)
+            if stripped:
+                break
+    
+    rows, rest = divmod(size + 1, cols + 1)
+    if rest:
+        raise ValueError("Tiled mode needs all grid rows to have the same length.")
+    return rows, cols, size
+
+
+def _count_adjacent_block(block: np.ndarray) -> np.ndarray:
+    """8-neighbor roll counts for a block of 0/1 rows, treating outside cells as empty."""
+    rows, cols = block.shape
+    padded = np.pad(block, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue  # Skip the position itself
+            counts += padded[dr : dr + rows, dc : dc + cols]
+    return counts
+
+
+def _load_band(task) -> None:
+    """
+    Worker: copy one band of the text grid into the 0/1 state file, checking
+    that every row of the band ends exactly at its expected newline.
+    """
+    input_path, state_path, rows, cols, size, lo, hi = task
+    text = np.memmap(input_path, dtype=np.uint8, mode="r")[:size]
+    state = np.memmap(state_path, dtype=np.uint8, mode="r+", shape=(rows, cols))
+    
+    band = np.array(text[lo * (cols + 1) : hi * (cols + 1)])
+    if band.size < (hi - lo) * (cols + 1):
+        band = np.append(band, np.uint8(ord("\n")))  # the last row may end at EOF
+    band = band.reshape(hi - lo, cols + 1)
+    if (band[:, cols] != ord("\n")).any():
+        raise ValueError("Tiled mode needs all grid rows to have the same length.")
+    
+    state[lo:hi] = band[:, :cols] == ord("@")
+    state.flush()
+
+
+def _find_band_removals(task) -> int:
+    """
+    Worker, phase 1 of a round: read a band plus one halo row on each side,
+    mark its accessible rolls in the pending file and return how many.
+    """
+    state_path, pending_path, rows, cols, lo, hi = task
+    state = np.memmap(state_path, dtype=np.uint8, mode="r", shape=(rows, cols))
+    pending = np.memmap(pending_path, dtype=np.uint8, mode="r+", shape=(rows, cols))
+    
+    top = max(lo - 1, 0)
+    block = np.array(state[top : min(hi + 1, rows)])
+    counts = _count_adjacent_block(block)[lo - top : lo - top + hi - lo]
+    removals = block[lo - top : lo - top + hi - lo] & (counts < 4)
+    
+    pending[lo:hi] = removals
+    pending.flush()
+    return int(np.count_nonzero(removals))
+
+
+def _apply_band_removals(task) -> None:
+    """Worker, phase 2 of a round: clear the band's pending rolls from the state."""
+    state_path, pending_path, rows, cols, lo, hi = task
+    state = np.memmap(state_path, dtype=np.uint8, mode="r+", shape=(rows, cols))
+    pending = np.memmap(pending_path, dtype=np.uint8, mode="r", shape=(rows, cols))
+    state[lo:hi] &= 1 - pending[lo:hi]
+    state.flush()
+
+
+def remove_accessible_rolls_tiled(path: str, band_rows: int = 1024, workers: Optional[int] = None) -> int:
+    """
+    remove_accessible_rolls_iteratively for grids too large to load.
+    
+    The grid is copied into a memory-mapped 0/1 state file and processed
+    in horizontal bands by a process pool. Every round has two phases, so
+    all bands see the same state: first each band reads itself plus one
+    halo row above and below and records its removals in a pending file,
+    then the removals are applied. A band is only revisited when it or a
+    neighboring band changed in the previous round. Each worker holds at
+    most band_rows + 2 rows in memory.
+    
+    Args:
+        path: Path to the grid file
+        band_rows: Number of grid rows per band
+        workers: Number of worker processes (default: CPU count)
+    
+    Returns:
+        Total number of rolls removed
+    """
+    rows, cols, size = _grid_file_shape(path)
+    if rows == 0:
+        return 0
+    
+    bands = [(lo, min(lo + band_rows, rows)) for lo in range(0, rows, band_rows)]
+    total_removed = 0
+    
+    with tempfile.TemporaryDirectory() as tmp, ProcessPoolExecutor(max_workers=workers) as pool:
+        state_path = os.path.join(tmp, "state.bin")
+        pending_path = os.path.join(tmp, "pending.bin")
+        for name in (state_path, pending_path):
+            with open(name, "wb") as f:
+                f.truncate(rows * cols)
+        
+        list(pool.map(_load_band, [(path, state_path, rows, cols, size, lo, hi) for lo, hi in bands]))
+        
+        active = set(range(len(bands)))
+        while active:
+            order = sorted(active)
+            tasks = [(state_path, pending_path, rows, cols) + bands[i] for i in order]
+            removed = list(pool.map(_find_band_removals, tasks))
+            
+            changed = [i for i, count in zip(order, removed) if count]
+            list(pool.map(_apply_band_removals,
+                          [(state_path, pending_path, rows, cols) + bands[i] for i in changed]))
+            total_removed += sum(removed)
+            
+            # Removals near a border change the counts in the neighboring band
+            active = {j for i in changed for j in (i - 1, i, i + 1) if 0 <= j < len(bands)}
+    
+    return total_removed
+
+
+def grid_to_array(grid: List[str]) -> np.ndarray:
+    """Convert a grid given as strings into a 2-D boolean roll array."""
+    if not grid:
+        return np.zeros((0, 0), dtype=bool)
+    return np.array([list(row) for row in grid]) == "@"
+
+
+NEIGHBORHOOD_SHAPES = ("chebyshev", "von_neumann")
+
+
+def _square_sums(padded: np.ndarray, radius: int, dtype) -> np.ndarray:
+    """
+    Sum of every (2r+1) x (2r+1) window of a grid padded by r on each side,
+    as four slices of one summed-area table.
+    """
+    k = 2 * radius + 1
+    table = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=dtype)
+    np.cumsum(np.cumsum(padded, axis=0, dtype=dtype), axis=1, out=table[1:, 1:])
+    return table[k:, k:] - table[:-k, k:] - table[k:, :-k] + table[:-k, :-k]
+
+
+def _diamond_sums(padded: np.ndarray, radius: int, dtype) -> np.ndarray:
+    """
+    Sum of every diamond |dr| + |dc| <= r of a grid padded by r on each side.
+    
+    A diamond is 2r+1 row segments. With row prefix sums P, the segment
+    right ends P[i+d, j+r-|d|+1] lie on one anti-diagonal for d >= 0 and on
+    one diagonal for d < 0 (the left ends likewise), so prefix sums of P
+    along both diagonal directions give each diamond from four differences.
+    """
+    height, width = padded.shape
+    row_prefix = np.zeros((height, width + 1), dtype=dtype)
+    np.cumsum(padded, axis=1, dtype=dtype, out=row_prefix[:, 1:])
+    
+    # diag[a + 1, b + 1] sums row_prefix down the diagonal ending at (a, b);
+    # anti[a + 1, b] sums it down the anti-diagonal ending at (a, b)
+    diag = np.zeros((height + 1, width + 2), dtype=dtype)
+    anti = np.zeros((height + 1, width + 2), dtype=dtype)
+    for a in range(height):
+        np.add(row_prefix[a], diag[a, :-1], out=diag[a + 1, 1:])
+        np.add(row_prefix[a], anti[a, 1:], out=anti[a + 1, :-1])
+    
+    rows, cols = height - 2 * radius, width - 2 * radius
+    
+    def at(table, dr, dc):
+        # table entries at (center row + dr, center column + dc) for every cell
+        return table[radius + dr : radius + dr + rows, radius + dc : radius + dc + cols]
+    
+    right = (at(anti, radius + 1, 1) - at(anti, 0, radius + 2)
+             + at(diag, 0, radius + 1) - at(diag, -radius, 1))
+    left = (at(diag, radius + 1, 1) - at(diag, 0, -radius)
+            + at(anti, 0, 1 - radius) - at(anti, -radius, 1))
+    return right - left
+
+
+def neighborhood_counts(rolls: np.ndarray, shape: str = "chebyshev", radius: int = 1) -> np.ndarray:
+    """
+    Count the rolls in the radius-r neighborhood of every cell, excluding
+    the cell itself, in O(1) per cell from prefix sums.
+    
+    "chebyshev" is the (2r+1) x (2r+1) square (radius 1 is the usual 8
+    neighbors), read from a summed-area table. "von_neumann" is the diamond
+    |dr| + |dc| <= r, read from diagonal prefix sums of the row prefix sums.
+    The grid is padded by r empty cells so every lookup is a plain slice,
+    and the tables are int32 whenever the counts fit.
+    
+    Args:
+        rolls: 2-D boolean array, True where there is a roll
+        shape: "chebyshev" or "von_neumann"
+        radius: Neighborhood radius (>= 1)
+    
+    Returns:
+        Integer array of the same shape with the neighbor counts
+    """
+    if shape not in NEIGHBORHOOD_SHAPES:
+        raise ValueError(f"Invalid neighborhood shape: {shape}. Must be one of {NEIGHBORHOOD_SHAPES}.")
+    
+    padded = np.pad(rolls, radius)
+    dtype = np.int32 if (padded.shape[0] + 1) * (padded.shape[1] + 2) < 2**31 else np.int64
+    if shape == "chebyshev":
+        totals = _square_sums(padded, radius, dtype)
+    else:
+        totals = _diamond_sums(padded, radius, dtype)
+    return totals - rolls
+
+
+def remove_accessible_rolls_configurable(
+    grid: List[str], shape: str = "chebyshev", radius: int = 1, threshold: int = 4
+) -> int:
+    """
+    remove_accessible_rolls_iteratively with a configurable rule: each
+    round removes every roll with fewer than threshold rolls in its
+    neighborhood. The defaults reproduce remove_accessible_rolls_iteratively.
+    """
+    if not grid:
+        return 0
+    
+    rolls = grid_to_array(grid)
+    total_removed = 0
+    
+    while True:
+        to_remove = rolls & (neighborhood_counts(rolls, shape, radius) < threshold)
+        removed = int(np.count_nonzero(to_remove))
+        if not removed:
+            break
+        
+        rolls &= ~to_remove
+        total_removed += removed
+    
+    return total_removed
+
+
+class RollGrid:
+    """
+    Grid state that keeps per-cell neighbor counts and the set of
+    accessible rolls (fewer than 4 adjacent rolls) up to date.
+    
+    Adding or removing a roll touches only its 8 neighbors, so the
+    accessible count after each edit costs O(1) instead of a full
+    count_accessible_rolls pass.
+    """
+    
+    OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+    
+    def __init__(self, grid: List[str]):
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows > 0 else 0
+        self.present = [[ch == '@' for ch in row] for row in grid]
+        self.counts = [[count_adjacent_rolls(grid, r, c) for c in range(self.cols)]
+                       for r in range(self.rows)]
+        self.accessible = {(r, c) for r in range(self.rows) for c in range(self.cols)
+                           if self.present[r][c] and self.counts[r][c] < 4}
+    
+    @property
+    def accessible_count(self) -> int:
+        return len(self.accessible)
+    
+    def _neighbors(self, row: int, col: int):
+        for dr, dc in self.OFFSETS:
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                yield nr, nc
+    
+    def _check_cell(self, row: int, col: int) -> None:
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"Cell ({row}, {col}) is outside the grid.")
+    
+    def add_roll(self, row: int, col: int) -> int:
+        """Place a roll at (row, col) and return the new accessible count."""
+        self._check_cell(row, col)
+        if self.present[row][col]:
+            raise ValueError(f"There is already a roll at ({row}, {col}).")
+        
+        self.present[row][col] = True
+        if self.counts[row][col] < 4:
+            self.accessible.add((row, col))
+        for nr, nc in self._neighbors(row, col):
+            self.counts[nr][nc] += 1
+            if self.counts[nr][nc] == 4:
+                self.accessible.discard((nr, nc))
+        return self.accessible_count
+    
+    def remove_roll(self, row: int, col: int) -> int:
+        """Take away the roll at (row, col) and return the new accessible count."""
+        self._check_cell(row, col)
+        if not self.present[row][col]:
+            raise ValueError(f"There is no roll at ({row}, {col}).")
+        
+        self.present[row][col] = False
+        self.accessible.discard((row, col))
+        for nr, nc in self._neighbors(row, col):
+            self.counts[nr][nc] -= 1
+            if self.counts[nr][nc] == 3 and self.present[nr][nc]:
+                self.accessible.add((nr, nc))
+        return self.accessible_count
+    
+    def peel(self) -> int:
+        """
+        Run remove_accessible_rolls_iteratively from the current state and
+        return the number of rolls removed. Each round removes the rolls
+        that were accessible when it started; the rolls that become
+        accessible meanwhile form the next round.
+        """
+        total_removed = 0
+        while self.accessible:
+            for row, col in list(self.accessible):
+                self.remove_roll(row, col)
+                total_removed += 1
+        return total_removed
+    
+    def to_grid(self) -> List[str]:
+        """Return the current state as a list of strings."""
+        return [''.join('@' if cell else '.' for cell in row) for row in self.present]
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")
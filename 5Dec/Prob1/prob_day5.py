@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Tuple
+
+import numpy as np
 
 
 def read_input_file(path: str) -> Tuple[List[Tuple[int, int]], List[int]]:
@@ -87,10 +90,89 @@ def is_fresh(ingredient_id: int, ranges: List[Tuple[int, int]]) -> bool:
     return False
 
 
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping or adjacent ranges.
+    
+    Args:
+        ranges: List of (start, end) inclusive ranges
+        
+    Returns:
+        List of merged non-overlapping ranges
+    """
+    if not ranges:
+        return []
+    
+    # Sort ranges by start value
+    sorted_ranges = sorted(ranges, key=lambda x: x[0])
+    
+    merged = []
+    current_start, current_end = sorted_ranges[0]
+    
+    for start, end in sorted_ranges[1:]:
+        # If ranges overlap or are adjacent, merge them
+        if start <= current_end + 1:
+            current_end = max(current_end, end)
+        else:
+            # No overlap, add current range and start new one
+            merged.append((current_start, current_end))
+            current_start, current_end = start, end
+    
+    # Add the last range
+    merged.append((current_start, current_end))
+    
+    return merged
+
+
+def build_range_index(merged_ranges: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """
+    Split merged (sorted, non-overlapping) ranges into parallel lists of
+    starts and ends for binary search.
+    
+    Args:
+        merged_ranges: Output of merge_ranges
+        
+    Returns:
+        Tuple of (starts, ends)
+    """
+    starts = [start for start, _ in merged_ranges]
+    ends = [end for _, end in merged_ranges]
+    return starts, ends
+
+
+def count_fresh_sorted(merged_ranges: List[Tuple[int, int]], sorted_ids: List[int]) -> int:
+    """
+    Count fresh IDs from a sorted ID list in one forward sweep.
+    
+    Both sequences are walked once, in order: for each merged range the ID
+    pointer jumps (by binary search from its current spot) past the IDs
+    below the range and then past the IDs inside it.
+    
+    Args:
+        merged_ranges: Output of merge_ranges
+        sorted_ids: Ingredient IDs in ascending order
+        
+    Returns:
+        Number of fresh ingredient IDs
+    """
+    count = 0
+    pos = 0
+    for start, end in merged_ranges:
+        pos = bisect_left(sorted_ids, start, pos)
+        inside_end = bisect_right(sorted_ids, end, pos)
+        count += inside_end - pos
+        pos = inside_end
+    return count
+
+
 def count_fresh_ingredients(ranges: List[Tuple[int, int]], available_ids: List[int]) -> int:
     """
     Count how many available ingredient IDs are fresh.
     
+    The ranges are merged once and the IDs are counted with the sorted
+    sweep in count_fresh_sorted. Unsorted IDs are sorted first, which is
+    cheaper in bulk than one binary search over the ranges per ID.
+    
     Args:
         ranges: List of fresh ingredient ID ranges
         available_ids: List of available ingredient IDs to check
@@ -98,10 +180,88 @@ def count_fresh_ingredients(ranges: List[Tuple[int, int]], available_ids: List[i
     Returns:
         Number of fresh ingredient IDs
     """
-    count = 0
-    for ingredient_id in available_ids:
-        if is_fresh(ingredient_id, ranges):
-            count += 1
+    merged_ranges = merge_ranges(ranges)
+    
+    if not all(a <= b for a, b in zip(available_ids, available_ids[1:])):
+        available_ids = sorted(available_ids)
+    
+    return count_fresh_sorted(merged_ranges, available_ids)
+
+
+# Longest ID the streaming parser accepts; 19 digits may overflow int64
+_MAX_ID_DIGITS = 18
+
+
+def _parse_id_chunk(data: bytes) -> np.ndarray:
+    """
+    Parse whitespace-separated IDs into an int64 array. np.fromstring
+    clamps out-of-range values instead of failing, so any token longer than
+    _MAX_ID_DIGITS bytes is rejected first.
+    """
+    token = np.frombuffer(data, dtype=np.uint8) > ord(" ")
+    edges = np.flatnonzero(np.diff(token, prepend=False, append=False))
+    if edges.size and (edges[1::2] - edges[::2]).max() > _MAX_ID_DIGITS:
+        raise ValueError(f"IDs longer than {_MAX_ID_DIGITS} digits do not fit in int64.")
+    return np.fromstring(data, dtype=np.int64, sep=" ")
+
+
+def iter_id_chunks(f, chunk_bytes: int) -> Iterator[np.ndarray]:
+    """
+    Read whitespace-separated IDs from an open binary file, chunk_bytes at
+    a time, and yield them as int64 arrays. A line cut by the chunk border
+    is carried over to the next chunk.
+    """
+    leftover = b""
+    while True:
+        data = f.read(chunk_bytes)
+        if not data:
+            break
+        data = leftover + data
+        cut = data.rfind(b"\n") + 1
+        leftover = data[cut:]
+        if data[:cut].strip():
+            yield _parse_id_chunk(data[:cut])
+    
+    if leftover.strip():
+        yield _parse_id_chunk(leftover)
+
+
+def count_fresh_streaming(path: str, chunk_bytes: int = 1 << 24) -> int:
+    """
+    Count fresh ingredient IDs without loading the ID list.
+    
+    The range section is read and merged first. The ID section is then
+    parsed chunk by chunk into int64 arrays, and each chunk is classified
+    at once with np.searchsorted against the merged range starts. Memory
+    is bounded by chunk_bytes and the number of ranges.
+    
+    Args:
+        path: Path to input file
+        chunk_bytes: Approximate number of bytes of IDs parsed per chunk
+        
+    Returns:
+        Number of fresh ingredient IDs
+    """
+    with open(path, "rb") as f:
+        ranges = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                break
+            start_str, end_str = line.split(b"-")
+            ranges.append((int(start_str), int(end_str)))
+        
+        starts, ends = (np.array(bounds, dtype=np.int64)
+                        for bounds in build_range_index(merge_ranges(ranges)))
+        if starts.size == 0:
+            return 0
+        
+        count = 0
+        for ids in iter_id_chunks(f, chunk_bytes):
+            idx = np.searchsorted(starts, ids, side="right") - 1
+            fresh = (idx >= 0) & (ids <= ends[np.maximum(idx, 0)])
+            count += int(np.count_nonzero(fresh))
+    
     return count
 
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
-from typing import List, Tuple
+import random
+from collections import Counter
+from typing import Iterable, List, Tuple
 
 
 def read_ranges_from_file(path: str) -> List[Tuple[int, int]]:
@@ -113,6 +115,199 @@ def count_all_fresh_ids(ranges: List[Tuple[int, int]]) -> int:
     return total
 
 
+# Lowest gap cover of a subtree that has no gaps
+_NO_GAP = float("inf")
+
+
+class _BreakpointNode:
+    __slots__ = ("key", "delta", "priority", "left", "right",
+                 "first", "last", "sum", "low", "low_len")
+    
+    def __init__(self, key: int, delta: int, priority: float):
+        self.key = key
+        self.delta = delta  # Ranges starting here minus ranges ending just before
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.first = self.last = key
+        self.sum = delta
+        self.low = _NO_GAP  # Lowest cover over the subtree's inner gaps
+        self.low_len = 0  # Total length of the gaps at that cover
+
+
+def _fold_gap(low, low_len, cover, length):
+    """Account for one gap of the given length and cover in a running minimum."""
+    if cover < low:
+        return cover, length
+    if cover == low:
+        return low, low_len + length
+    return low, low_len
+
+
+class FreshRangeSet:
+    """
+    Fresh ID ranges that can be added and removed while the total number of
+    fresh IDs and point membership stay available without a re-merge.
+    
+    A range [start, end] adds +1 at breakpoint start and -1 at end + 1. The
+    breakpoints live in a treap keyed on position, and every node knows, for
+    the gaps between consecutive breakpoints of its subtree, the lowest
+    cover count and how many IDs sit at it. Covers never go below 0, so the
+    uncovered IDs are exactly the gaps at cover 0 and the total comes from
+    the root in O(1). Adding or removing a range touches two breakpoints in
+    O(log n), membership is one O(log n) descent and memory is O(n).
+    """
+    
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = (), seed=None):
+        self.ranges = Counter()
+        self._random = random.Random(seed)
+        
+        deltas = Counter()
+        for start, end in ranges:
+            if end < start:
+                raise ValueError(f"Invalid range: {start}-{end}.")
+            self.ranges[start, end] += 1
+            deltas[start] += 1
+            deltas[end + 1] -= 1
+        
+        nodes = [_BreakpointNode(key, deltas[key], 0.0) for key in sorted(deltas) if deltas[key]]
+        self._root = self._build(nodes, 0, len(nodes))
+        
+        # Heap-ordered priorities in level order keep the built tree a valid treap
+        priorities = sorted((self._random.random() for _ in nodes), reverse=True)
+        level = [self._root] if self._root else []
+        i = 0
+        while level:
+            next_level = []
+            for node in level:
+                node.priority = priorities[i]
+                i += 1
+                next_level.extend(child for child in (node.left, node.right) if child)
+            level = next_level
+    
+    @property
+    def total(self) -> int:
+        """Number of fresh IDs in the current union."""
+        root = self._root
+        if root is None:
+            return 0
+        uncovered = root.low_len if root.low == 0 else 0
+        return root.last - root.first - uncovered
+    
+    def __contains__(self, ingredient_id: int) -> bool:
+        cover = 0
+        node = self._root
+        while node:
+            if ingredient_id < node.key:
+                node = node.left
+            else:
+                cover += (node.left.sum if node.left else 0) + node.delta
+                node = node.right
+        return cover > 0
+    
+    def _build(self, nodes, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._build(nodes, lo, mid)
+        node.right = self._build(nodes, mid + 1, hi)
+        self._pull(node)
+        return node
+    
+    @staticmethod
+    def _pull(node) -> None:
+        left, right = node.left, node.right
+        low, low_len, cover = _NO_GAP, 0, 0
+        if left:
+            low, low_len, cover = left.low, left.low_len, left.sum
+            low, low_len = _fold_gap(low, low_len, cover, node.key - left.last)
+        cover += node.delta
+        if right:
+            low, low_len = _fold_gap(low, low_len, cover, right.first - node.key)
+            low, low_len = _fold_gap(low, low_len, cover + right.low, right.low_len)
+            cover += right.sum
+        node.first = left.first if left else node.key
+        node.last = right.last if right else node.key
+        node.sum = cover
+        node.low, node.low_len = low, low_len
+    
+    def _merge(self, first, second):
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first.priority > second.priority:
+            first.right = self._merge(first.right, second)
+            self._pull(first)
+            return first
+        second.left = self._merge(first, second.left)
+        self._pull(second)
+        return second
+    
+    def _shift(self, node, key: int, delta: int):
+        """Add delta at breakpoint key, creating or dropping its node as needed."""
+        if node is None:
+            return _BreakpointNode(key, delta, self._random.random())
+        if key == node.key:
+            node.delta += delta
+            if not node.delta:
+                return self._merge(node.left, node.right)
+        elif key < node.key:
+            node.left = self._shift(node.left, key, delta)
+            if node.left and node.left.priority > node.priority:
+                top, node.left = node.left, node.left.right
+                self._pull(node)
+                top.right, node = node, top
+        else:
+            node.right = self._shift(node.right, key, delta)
+            if node.right and node.right.priority > node.priority:
+                top, node.right = node.right, node.right.left
+                self._pull(node)
+                top.left, node = node, top
+        self._pull(node)
+        return node
+    
+    def add(self, start: int, end: int) -> int:
+        """Add the inclusive range [start, end] and return the new fresh total."""
+        if end < start:
+            raise ValueError(f"Invalid range: {start}-{end}.")
+        self.ranges[start, end] += 1
+        self._root = self._shift(self._root, start, 1)
+        self._root = self._shift(self._root, end + 1, -1)
+        return self.total
+    
+    def remove(self, start: int, end: int) -> int:
+        """Remove one copy of a previously added range and return the new fresh total."""
+        if not self.ranges[start, end]:
+            raise ValueError(f"Range {start}-{end} was never added.")
+        self.ranges[start, end] -= 1
+        if not self.ranges[start, end]:
+            del self.ranges[start, end]
+        self._root = self._shift(self._root, start, -1)
+        self._root = self._shift(self._root, end + 1, 1)
+        return self.total
+    
+    def merged_ranges(self) -> List[Tuple[int, int]]:
+        """Return the current union as merged (start, end) ranges."""
+        merged: List[Tuple[int, int]] = []
+        cover = 0
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if not cover:
+                block_start = node.key
+            cover += node.delta
+            if not cover:
+                merged.append((block_start, node.key - 1))
+            node = node.right
+        return merged
+
+
 def main() -> None:
     here = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(here, "input.txt")